@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import Author, Book
 
 
@@ -40,10 +41,14 @@ class AuthorAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     inlines = [BookInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_book_count=Count('books'))
+
     def book_count(self, obj):
-        return obj.books.count()
+        return obj._book_count
 
     book_count.short_description = 'Books'
+    book_count.admin_order_field = '_book_count'
 
 
 @admin.register(Book)
@@ -53,7 +58,7 @@ class BookAdmin(admin.ModelAdmin):
     search_fields = ['title', 'isbn', 'publisher', 'description']
     ordering = ['-publication_date', 'title']
     date_hierarchy = 'publication_date'
-    filter_horizontal = ['authors']
+    autocomplete_fields = ['authors']
 
     fieldsets = (
         ('Book Information', {
@@ -73,10 +78,14 @@ class BookAdmin(admin.ModelAdmin):
 
     readonly_fields = ['created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_author_count=Count('authors'))
+
     def author_count(self, obj):
-        return obj.authors.count()
+        return obj._author_count
 
     author_count.short_description = 'Authors'
+    author_count.admin_order_field = '_author_count'
 
 
 admin.site.site_header = "Books & Authors Administration"
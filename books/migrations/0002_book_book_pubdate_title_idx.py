@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-29 08:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['-publication_date', 'title'], name='book_pubdate_title_idx'),
+        ),
+    ]
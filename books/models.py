@@ -1,6 +1,6 @@
 from django.db import models
 from django.core.validators import MinLengthValidator
-from async_property import async_property
+from django.utils.functional import cached_property
 
 
 class Author(models.Model):
@@ -55,7 +55,7 @@ class Author(models.Model):
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
@@ -117,6 +117,7 @@ class Book(models.Model):
         indexes = [
             models.Index(fields=['isbn']),
             models.Index(fields=['publication_date']),
+            models.Index(fields=['-publication_date', 'title'], name='book_pubdate_title_idx'),
         ]
 
     def __str__(self):
@@ -125,8 +126,3 @@ class Book(models.Model):
     @property
     def author_names(self) -> str:
         return ", ".join([author.full_name for author in self.authors.all()])
-
-    @async_property
-    async def aauthor_names(self) -> str:
-        authors = [author async for author in self.authors.all()]
-        return ", ".join([author.full_name for author in authors])
@@ -1,12 +1,19 @@
+import re
+
 from adrf import serializers as adrf_serializers
-from adrf.fields import SerializerMethodField
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers as drf_serializers
+from rest_framework.serializers import SerializerMethodField
 
 from .models import Author, Book
 
+# Strips separators in a single C-level pass; the regex then validates
+# digit content and length (10 or 13) in one shot.
+_ISBN_CLEAN = str.maketrans('', '', '- ')
+_ISBN_RE = re.compile(r'\d{10}(?:\d{3})?')
+
 
-class AuthorListSerializer(adrf_serializers.ModelSerializer):
+class AuthorListSerializer(drf_serializers.ModelSerializer):
     full_name = drf_serializers.ReadOnlyField()
     book_count = SerializerMethodField()
 
@@ -15,8 +22,11 @@ class AuthorListSerializer(adrf_serializers.ModelSerializer):
         fields = ['id', 'first_name', 'last_name', 'full_name', 'nationality', 'book_count']
 
     @extend_schema_field(drf_serializers.IntegerField)
-    async def get_book_count(self, obj) -> int:
-        return await obj.books.acount()
+    def get_book_count(self, obj) -> int:
+        count = getattr(obj, '_book_count', None)
+        # Keep the fallback as a bare .count() — chaining .all() first
+        # stops Django 5 from eliding the join through the M2M table.
+        return count if count is not None else obj.books.count()
 
 
 class AuthorDetailSerializer(adrf_serializers.ModelSerializer):
@@ -37,12 +47,18 @@ class AuthorDetailSerializer(adrf_serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
     @extend_schema_field(drf_serializers.IntegerField)
-    async def get_book_count(self, obj) -> int:
-        return await obj.books.acount()
+    def get_book_count(self, obj) -> int:
+        cache = getattr(self, '_book_count_cache', None)
+        if cache is None:
+            cache = self._book_count_cache = {}
+        if obj.pk not in cache:
+            count = getattr(obj, '_book_count', None)
+            cache[obj.pk] = count if count is not None else obj.books.count()
+        return cache[obj.pk]
 
     @extend_schema_field(drf_serializers.ListField(child=drf_serializers.DictField()))
-    async def get_books(self, obj) -> list[dict[str, str | int]]:
-        return [{'id': book.id, 'title': book.title, 'isbn': book.isbn} async for book in obj.books.all()]
+    def get_books(self, obj) -> list[dict[str, str | int]]:
+        return [{'id': book.id, 'title': book.title, 'isbn': book.isbn} for book in obj.books.all()]
 
 
 class AuthorWriteSerializer(adrf_serializers.ModelSerializer):
@@ -55,9 +71,19 @@ class AuthorWriteSerializer(adrf_serializers.ModelSerializer):
         ]
 
 
-class BookListSerializer(adrf_serializers.ModelSerializer):
+class _AuthorMiniSerializer(drf_serializers.ModelSerializer):
+    """Lightweight author projection for nesting, reads only prefetched attributes."""
+
+    full_name = drf_serializers.ReadOnlyField()
+
+    class Meta:
+        model = Author
+        fields = ['id', 'first_name', 'last_name', 'full_name', 'nationality']
+
+
+class BookListSerializer(drf_serializers.ModelSerializer):
     author_count = SerializerMethodField()
-    authors = AuthorListSerializer(many=True, read_only=True)
+    authors = _AuthorMiniSerializer(many=True, read_only=True)
 
     class Meta:
         model = Book
@@ -68,8 +94,9 @@ class BookListSerializer(adrf_serializers.ModelSerializer):
         ]
 
     @extend_schema_field(drf_serializers.IntegerField)
-    async def get_author_count(self, obj) -> int:
-        return await obj.authors.acount()
+    def get_author_count(self, obj) -> int:
+        count = getattr(obj, '_author_count', None)
+        return count if count is not None else obj.authors.count()
 
 
 class BookDetailSerializer(adrf_serializers.ModelSerializer):
@@ -88,12 +115,26 @@ class BookDetailSerializer(adrf_serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
     @extend_schema_field(drf_serializers.IntegerField)
-    async def get_author_count(self, obj) -> int:
-        return await obj.authors.acount()
+    def get_author_count(self, obj) -> int:
+        cache = getattr(self, '_author_count_cache', None)
+        if cache is None:
+            cache = self._author_count_cache = {}
+        if obj.pk not in cache:
+            count = getattr(obj, '_author_count', None)
+            cache[obj.pk] = count if count is not None else obj.authors.count()
+        return cache[obj.pk]
 
     @extend_schema_field(drf_serializers.CharField)
-    async def get_author_names(self, obj) -> str:
-        return await obj.aauthor_names
+    def get_author_names(self, obj) -> str:
+        cache = getattr(self, '_author_names_cache', None)
+        if cache is None:
+            cache = self._author_names_cache = {}
+        if obj.pk not in cache:
+            names = getattr(obj, '_author_names', None)
+            if names is None:
+                names = ", ".join(author.full_name for author in obj.authors.all())
+            cache[obj.pk] = names
+        return cache[obj.pk]
 
 
 class BookWriteSerializer(adrf_serializers.ModelSerializer):
@@ -110,12 +151,12 @@ class BookWriteSerializer(adrf_serializers.ModelSerializer):
         }
 
     def validate_isbn(self, value):
-        isbn = value.replace('-', '').replace(' ', '')
-        if not isbn.isdigit():
-            raise drf_serializers.ValidationError("ISBN must contain only digits (hyphens and spaces are allowed).")
-        if len(isbn) not in [10, 13]:
+        isbn = value.translate(_ISBN_CLEAN)
+        if not _ISBN_RE.fullmatch(isbn):
+            if not isbn.isdigit():
+                raise drf_serializers.ValidationError("ISBN must contain only digits (hyphens and spaces are allowed).")
             raise drf_serializers.ValidationError("ISBN must be either 10 or 13 digits long.")
-        return value
+        return isbn
 
     def validate(self, attrs):
         authors = attrs.get('authors', [])
@@ -1,9 +1,13 @@
 import asyncio
 from adrf import viewsets
-from datetime import date, timedelta
+from asgiref.sync import sync_to_async
+from datetime import date
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Q, Avg, Max, Min
+from django.contrib.postgres.aggregates import StringAgg
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Prefetch, Q, Avg, Max, Min, Value
+from django.db.models.functions import Concat
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from drf_spectacular.utils import extend_schema, OpenApiParameter
@@ -18,11 +22,74 @@ from .serializers import (
 )
 
 
+# How many years back the `recent` books action looks.
+RECENT_YEARS = 5
+
+# adrf's router binds CRUD routes to the a-prefixed handlers, so at
+# request time self.action is 'alist'/'aretrieve'/... — match both
+# spellings wherever behavior branches on the action.
+LIST_ACTIONS = ('list', 'alist')
+RETRIEVE_ACTIONS = ('retrieve', 'aretrieve')
+WRITE_ACTIONS = (
+    'create', 'acreate',
+    'update', 'aupdate',
+    'partial_update', 'partial_aupdate',
+)
+
+
 async def _to_list(queryset):
     return [item async for item in queryset]
 
 
-class AuthorViewSet(viewsets.ModelViewSet):
+async def _to_list_streamed(queryset, chunk_size=500):
+    """Materialize a queryset in server-side chunks to cap peak memory.
+
+    Passing chunk_size keeps prefetch_related working per batch
+    (supported since Django 4.1).
+    """
+    return [item async for item in queryset.aiterator(chunk_size=chunk_size)]
+
+
+class AutoPrefetchMixin:
+    """Derive prefetches for relational serializer fields on read actions.
+
+    Walks the active serializer's fields and adds prefetch_related /
+    select_related for any model relation a field exposes, so new nested
+    fields do not silently reintroduce N+1 queries. Viewsets call
+    auto_prefetch as the last step of get_queryset; lookups already
+    configured there (including tailored Prefetch objects) take
+    precedence and are left untouched.
+    """
+
+    def auto_prefetch(self, queryset):
+        if self.action not in LIST_ACTIONS + RETRIEVE_ACTIONS:
+            return queryset
+
+        covered = {
+            lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+            for lookup in queryset._prefetch_related_lookups
+        }
+
+        for name, field in self.get_serializer_class()().fields.items():
+            source = field.source or name
+            if source == '*' or '.' in source:
+                continue
+            try:
+                model_field = queryset.model._meta.get_field(source)
+            except FieldDoesNotExist:
+                continue
+            if not model_field.is_relation:
+                continue
+            if model_field.many_to_many or model_field.one_to_many:
+                if source not in covered:
+                    queryset = queryset.prefetch_related(source)
+                    covered.add(source)
+            else:
+                queryset = queryset.select_related(source)
+        return queryset
+
+
+class AuthorViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     queryset = Author.objects.all()
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['nationality', 'birth_date']
@@ -31,17 +98,23 @@ class AuthorViewSet(viewsets.ModelViewSet):
     ordering = ['last_name', 'first_name']
 
     def get_serializer_class(self):
-        if self.action == 'list':
+        if self.action in LIST_ACTIONS:
             return AuthorListSerializer
-        elif self.action in ['create', 'update', 'partial_update']:
+        elif self.action in WRITE_ACTIONS:
             return AuthorWriteSerializer
         return AuthorDetailSerializer
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        if self.action in ['list', 'retrieve']:
-            queryset = queryset.prefetch_related('books')
-        return queryset
+        if self.action in LIST_ACTIONS:
+            queryset = queryset.only(
+                'id', 'first_name', 'last_name', 'nationality'
+            ).annotate(_book_count=Count('books'))
+        elif self.action in RETRIEVE_ACTIONS:
+            queryset = queryset.prefetch_related(
+                Prefetch('books', queryset=Book.objects.only('id', 'title', 'isbn'))
+            ).annotate(_book_count=Count('books'))
+        return self.auto_prefetch(queryset)
 
     @extend_schema(
         summary="Get author statistics",
@@ -54,21 +127,27 @@ class AuthorViewSet(viewsets.ModelViewSet):
             book_count=Count('books')
         ).order_by('-book_count')
 
-        authors_without_books = Author.objects.annotate(
-            book_count=Count('books')
-        ).filter(book_count=0)
+        # Anti-join instead of GROUP BY ... HAVING count = 0: the planner
+        # satisfies books__isnull=True from the M2M index without
+        # aggregating over every author.
+        authors_without_books = Author.objects.filter(books__isnull=True)
 
-        aggregated_stats, top_authors, authors_without_books_list, authors_without_books_count = await asyncio.gather(
+        aggregated_stats, top_authors, authors_without_books_list = await asyncio.gather(
             authors_with_book_count.aaggregate(
                 total_authors=Count('id'),
                 avg_books_per_author=Avg('book_count'),
                 max_books=Max('book_count'),
                 min_books=Min('book_count'),
+                authors_without_books_count=Count('id', filter=Q(book_count=0)),
             ),
-            _to_list(authors_with_book_count[:5]),
-            _to_list(authors_without_books[:10]),
-            authors_without_books.acount()
+            _to_list(authors_with_book_count.values(
+                'id', 'first_name', 'last_name', 'nationality', 'book_count'
+            )[:5]),
+            _to_list(authors_without_books.values(
+                'id', 'first_name', 'last_name', 'nationality'
+            )[:10]),
         )
+        authors_without_books_count = aggregated_stats['authors_without_books_count']
 
         return Response({
             'aggregated_statistics': {
@@ -82,19 +161,19 @@ class AuthorViewSet(viewsets.ModelViewSet):
                 'count': authors_without_books_count,
                 'authors': [
                     {
-                        'id': author.id,
-                        'name': author.full_name,
-                        'nationality': author.nationality
+                        'id': author['id'],
+                        'name': f"{author['first_name']} {author['last_name']}",
+                        'nationality': author['nationality']
                     }
                     for author in authors_without_books_list
                 ]
             },
             'top_authors': [
                 {
-                    'id': author.id,
-                    'name': author.full_name,
-                    'nationality': author.nationality,
-                    'book_count': author.book_count
+                    'id': author['id'],
+                    'name': f"{author['first_name']} {author['last_name']}",
+                    'nationality': author['nationality'],
+                    'book_count': author['book_count']
                 }
                 for author in top_authors
             ]
@@ -107,14 +186,23 @@ class AuthorViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     async def books(self, request, pk=None):
         author = await self.aget_object()
-        books_qs = author.books.prefetch_related('authors')
-        books = [book async for book in books_qs]
+        # Annotate from an unfiltered Book queryset: counting 'authors'
+        # on author.books would reuse the M2M join already constrained
+        # to this author and report 1 for every book.
+        books_qs = Book.objects.filter(
+            pk__in=author.books.values('pk')
+        ).only(
+            'id', 'title', 'isbn', 'publication_date', 'publisher', 'language'
+        ).prefetch_related(
+            Prefetch('authors', queryset=Author.objects.only('id', 'first_name', 'last_name', 'nationality'))
+        ).annotate(_author_count=Count('authors'))
+        books = await _to_list(books_qs)
 
         serializer = BookListSerializer(books, many=True)
-        return Response(await serializer.adata)
+        return Response(await sync_to_async(lambda: serializer.data, thread_sensitive=False)())
 
 
-class BookViewSet(viewsets.ModelViewSet):
+class BookViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     queryset = Book.objects.all()
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['language', 'publisher', 'publication_date']
@@ -123,17 +211,29 @@ class BookViewSet(viewsets.ModelViewSet):
     ordering = ['-publication_date', 'title']
 
     def get_serializer_class(self):
-        if self.action == 'list':
+        if self.action in LIST_ACTIONS:
             return BookListSerializer
-        elif self.action in ['create', 'update', 'partial_update']:
+        elif self.action in WRITE_ACTIONS:
             return BookWriteSerializer
         return BookDetailSerializer
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        if self.action in ['list', 'retrieve']:
-            queryset = queryset.prefetch_related('authors')
-        return queryset
+        if self.action in LIST_ACTIONS:
+            queryset = queryset.only(
+                'id', 'title', 'isbn', 'publication_date', 'publisher', 'language'
+            ).prefetch_related(
+                Prefetch('authors', queryset=Author.objects.only('id', 'first_name', 'last_name', 'nationality'))
+            ).annotate(_author_count=Count('authors'))
+        elif self.action in RETRIEVE_ACTIONS:
+            queryset = queryset.prefetch_related('authors').annotate(_author_count=Count('authors'))
+            queryset = queryset.annotate(
+                _author_names=StringAgg(
+                    Concat('authors__first_name', Value(' '), 'authors__last_name'),
+                    delimiter=', '
+                )
+            )
+        return self.auto_prefetch(queryset)
 
     @extend_schema(
         summary="Get book statistics",
@@ -151,27 +251,26 @@ class BookViewSet(viewsets.ModelViewSet):
             count=Count('id')
         ).order_by('-count')
 
-        book_stats, aggregated_stats, books_by_language, collaborative_books_list, collaborative_books_count = await asyncio.gather(
+        aggregated_stats, books_by_language, collaborative_books_list = await asyncio.gather(
             books_with_author_count.aaggregate(
-                avg_authors_per_book=Avg('author_count'),
-            ),
-            Book.objects.aaggregate(
                 total_books=Count('id'),
                 avg_pages=Avg('pages'),
                 max_pages=Max('pages'),
                 min_pages=Min('pages'),
                 latest_publication=Max('publication_date'),
                 earliest_publication=Min('publication_date'),
+                avg_authors_per_book=Avg('author_count'),
+                collaborative_books_count=Count('id', filter=Q(author_count__gt=1)),
             ),
             _to_list(books_by_language_qs),
-            _to_list(collaborative_books[:10]),
-            collaborative_books.acount()
+            _to_list(collaborative_books.values('id', 'title', 'isbn', 'author_count')[:10]),
         )
+        collaborative_books_count = aggregated_stats['collaborative_books_count']
 
         return Response({
             'aggregated_statistics': {
                 'total_books': aggregated_stats['total_books'],
-                'average_authors_per_book': round(book_stats['avg_authors_per_book'] or 0, 2),
+                'average_authors_per_book': round(aggregated_stats['avg_authors_per_book'] or 0, 2),
                 'average_pages': round(aggregated_stats['avg_pages'] or 0, 0),
                 'max_pages': aggregated_stats['max_pages'] or 0,
                 'min_pages': aggregated_stats['min_pages'] or 0,
@@ -183,10 +282,10 @@ class BookViewSet(viewsets.ModelViewSet):
                 'count': collaborative_books_count,
                 'books': [
                     {
-                        'id': book.id,
-                        'title': book.title,
-                        'isbn': book.isbn,
-                        'author_count': book.author_count
+                        'id': book['id'],
+                        'title': book['title'],
+                        'isbn': book['isbn'],
+                        'author_count': book['author_count']
                     }
                     for book in collaborative_books_list
                 ]
@@ -200,18 +299,27 @@ class BookViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'])
     async def recent(self, request):
-        five_years_ago = date.today() - timedelta(days=5 * 365)
+        today = date.today()
+        try:
+            five_years_ago = today.replace(year=today.year - RECENT_YEARS)
+        except ValueError:
+            # Feb 29 with no leap-day counterpart five years back.
+            five_years_ago = today.replace(year=today.year - RECENT_YEARS, day=28)
 
         recent_books = Book.objects.filter(
             publication_date__gte=five_years_ago
+        ).only(
+            'id', 'title', 'isbn', 'publication_date', 'publisher', 'language'
+        ).prefetch_related(
+            Prefetch('authors', queryset=Author.objects.only('id', 'first_name', 'last_name', 'nationality'))
         ).annotate(
-            author_count=Count('authors')
+            _author_count=Count('authors')
         ).order_by('-publication_date')
 
-        recent_books_list = await _to_list(recent_books)
+        recent_books_list = await _to_list_streamed(recent_books)
         serializer = BookListSerializer(recent_books_list, many=True)
 
         return Response({
             'count': len(recent_books_list),
-            'books': await serializer.adata
+            'books': await sync_to_async(lambda: serializer.data, thread_sensitive=False)()
         })